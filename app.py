@@ -4,10 +4,16 @@ FOMC Decision Validation Tool
 A Streamlit application for validating LLM-extracted policy decisions
 from Federal Reserve FOMC meeting transcripts.
 """
+import csv
+import io
+import re
 import streamlit as st
 import pandas as pd
-import json
+import orjson
+import ijson
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
+from typing import Optional
 
 from config import (
     TARGET_MEETINGS,
@@ -16,20 +22,25 @@ from config import (
     OCCURRENCE_OPTIONS,
     DECISION_TYPES,
     CONFIDENCE_LEVELS,
-    ASSESSMENT_OPTIONS
+    ASSESSMENT_OPTIONS,
+    TRANSCRIPT_PAGE_WORDS
 )
 from utils.data_loader import (
-    load_transcripts_df,
-    load_alternatives_df,
     load_transcript,
+    load_transcript_df,
     load_alternatives,
     load_decisions,
+    get_decision_count,
+    get_decisions_mtime,
     get_transcript_stats,
+    format_utterances,
+    paginate_transcript,
     search_transcript
 )
 from utils.export import (
     save_coding_results,
-    export_to_csv
+    export_to_csv,
+    get_results_filename
 )
 
 
@@ -41,6 +52,105 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Precomputed meeting selector options
+_MEETING_OPTIONS = {ymd: info['display_name'] for ymd, info in TARGET_MEETINGS.items()}
+_MEETING_DISPLAYS = list(_MEETING_OPTIONS.values())
+_MEETING_IDX_BY_YMD = {ymd: i for i, ymd in enumerate(_MEETING_OPTIONS)}
+_YMD_BY_DISPLAY = {display: ymd for ymd, display in _MEETING_OPTIONS.items()}
+
+# Precomputed option lookups for the validation widgets
+_OCCURRED_LABELS = list(OCCURRENCE_OPTIONS.values())
+_OCCURRED_KEY_BY_LABEL = {label: key for key, label in OCCURRENCE_OPTIONS.items()}
+
+_ASSESSMENT_LABELS = list(ASSESSMENT_OPTIONS.values())
+_ASSESSMENT_KEY_BY_LABEL = {label: key for key, label in ASSESSMENT_OPTIONS.items()}
+
+_CONFIDENCE_LABELS = ("High confidence", "Medium confidence", "Low confidence / uncertain")
+_CONFIDENCE_IDX = {label: i for i, label in enumerate(_CONFIDENCE_LABELS)}
+_CONFIDENCE_LABEL_BY_LEVEL = dict(zip(CONFIDENCE_LEVELS, _CONFIDENCE_LABELS))
+
+_HAS_MISSING_OPTIONS = ("No, Claude captured all major decisions", "Yes, there are missing decisions")
+
+# Session-state keys owned by the coding widgets. Cleared whenever the
+# underlying records are replaced so the widgets re-seed from them.
+_DECISION_WIDGET_NAMES = (
+    "occurred", "corrected_desc", "type_agree", "type_override",
+    "score", "evidence", "notes", "confidence"
+)
+_MISSING_WIDGET_PREFIXES = ("missing_desc_", "missing_type_", "missing_score_", "missing_evidence_")
+_CODING_WIDGET_PREFIXES = tuple(f"{name}_" for name in _DECISION_WIDGET_NAMES) + _MISSING_WIDGET_PREFIXES
+_SUMMARY_WIDGET_KEYS = ("has_missing_decisions", "overall_assessment", "general_notes")
+
+# Shortest transcript search term worth scanning for
+_MIN_SEARCH_LENGTH = 3
+
+
+# Cached loader wrappers. Streamlit reruns the whole script on every widget
+# interaction, so these keep file parsing to once per meeting.
+@st.cache_resource(show_spinner=False)
+def _cached_decision_records(ymd: str, decisions_mtime: float) -> Optional[list]:
+    """Shared, read-only decisions for a meeting as row dicts (mtime keys edits to the CSV)."""
+    decisions_df = load_decisions(ymd)
+    if decisions_df is None:
+        return None
+    return decisions_df.fillna({'justification': ''}).to_dict(orient='records')
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_transcript_lines(ymd: str) -> pd.Series:
+    """Shared formatted utterances for a meeting, used for search."""
+    return format_utterances(load_transcript_df(ymd))
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_transcript_pages(ymd: str) -> list:
+    """Shared transcript pages for a meeting."""
+    return paginate_transcript(load_transcript(ymd), TRANSCRIPT_PAGE_WORDS)
+
+
+@dataclass(slots=True)
+class Validation:
+    """A coder's validation of one of Claude's extracted decisions."""
+    decision_index: int
+    human_occurred: Optional[str] = None
+    human_corrected_description: Optional[str] = None
+    human_type_agree: Optional[bool] = None
+    human_type_override: Optional[str] = None
+    human_score: Optional[int] = None
+    human_evidence: str = ''
+    human_notes: str = ''
+    human_confidence: Optional[str] = None
+    completed: bool = False
+
+
+_VALIDATION_FIELDS = frozenset(f.name for f in fields(Validation))
+
+
+@dataclass
+class MeetingCtx:
+    """Data for the selected meeting, loaded once per rerun."""
+    ymd: str
+    decisions_df: pd.DataFrame
+    decision_records: list
+    stats: dict
+    alternatives: list
+
+
+def build_meeting_ctx(ymd: str) -> Optional[MeetingCtx]:
+    """Load everything the page needs for a meeting (None if no decisions file)."""
+    decisions_mtime = get_decisions_mtime(ymd)
+    decisions_df = load_decisions(ymd)
+    if decisions_mtime is None or decisions_df is None:
+        return None
+
+    return MeetingCtx(
+        ymd=ymd,
+        decisions_df=decisions_df,
+        decision_records=_cached_decision_records(ymd, decisions_mtime),
+        stats=get_transcript_stats(ymd),
+        alternatives=load_alternatives(ymd)
+    )
+
 
 def init_session_state():
     """Initialize session state variables."""
@@ -71,6 +181,13 @@ def init_session_state():
         st.session_state.just_restored = False
 
 
+    if 'transcript_page' not in st.session_state:
+        st.session_state.transcript_page = 0
+
+    if 'focused_decision' not in st.session_state:
+        st.session_state.focused_decision = 0
+
+
 def reset_coding_state():
     """Reset coding state when meeting changes."""
     st.session_state.decision_validations = {}
@@ -81,31 +198,50 @@ def reset_coding_state():
         'overall_assessment': None,
         'general_notes': ''
     }
+    st.session_state.transcript_page = 0
+    st.session_state.focused_decision = 0
+    clear_coding_widget_state()
 
 
-def get_validation_for_decision(decision_idx: int) -> dict:
-    """Get or create validation dict for a decision."""
-    if decision_idx not in st.session_state.decision_validations:
-        st.session_state.decision_validations[decision_idx] = {
-            'decision_index': decision_idx,
-            'human_occurred': None,
-            'human_corrected_description': None,
-            'human_type_agree': None,
-            'human_type_override': None,
-            'human_score': None,
-            'human_evidence': '',
-            'human_notes': '',
-            'human_confidence': None,
-            'completed': False
-        }
-    return st.session_state.decision_validations[decision_idx]
+def clear_coding_widget_state():
+    """Drop all coding widget values so they re-seed from the stored records."""
+    for key in list(st.session_state.keys()):
+        if key.startswith(_CODING_WIDGET_PREFIXES) or key in _SUMMARY_WIDGET_KEYS:
+            del st.session_state[key]
+
+
+def clear_missing_widget_state():
+    """Drop missing-decision widget values so they re-seed from the stored list."""
+    for key in list(st.session_state.keys()):
+        if key.startswith(_MISSING_WIDGET_PREFIXES):
+            del st.session_state[key]
+
+
+def get_validation_for_decision(decision_idx: int) -> Validation:
+    """Get or create the validation record for a decision."""
+    validations = st.session_state.decision_validations
+    validation = validations.get(decision_idx)
+    if validation is None:
+        validation = validations[decision_idx] = Validation(decision_index=decision_idx)
+    return validation
+
+
+def get_validations(total_decisions: int) -> list:
+    """Get (creating as needed) the validation records for every decision, in order."""
+    return [get_validation_for_decision(i) for i in range(total_decisions)]
+
+
+def _update_field(validation: Validation, field: str, value) -> None:
+    """Write a widget value into a validation record only if it changed."""
+    if getattr(validation, field) != value:
+        setattr(validation, field, value)
 
 
 def count_completed_decisions() -> int:
     """Count completed decision validations."""
     return sum(
         1 for v in st.session_state.decision_validations.values()
-        if v.get('completed', False)
+        if v.completed
     )
 
 
@@ -115,64 +251,83 @@ def find_first_incomplete_decision(total_decisions: int) -> int:
     Returns:
         Index of first incomplete decision (0-based), or -1 if all complete.
     """
+    validations = st.session_state.decision_validations
     for idx in range(total_decisions):
-        if idx not in st.session_state.decision_validations:
-            return idx
-        if not st.session_state.decision_validations[idx].get('completed', False):
+        validation = validations.get(idx)
+        if validation is None or not validation.completed:
             return idx
     return -1  # All complete
 
 
+def _read_json_section(uploaded_file, prefix: str, default):
+    """Stream-parse a single top-level section of an uploaded JSON file."""
+    uploaded_file.seek(0)
+    return next(ijson.items(uploaded_file, prefix, use_float=True), default)
+
+
 def restore_from_uploaded_json(uploaded_file):
-    """Restore coding progress from an uploaded JSON file."""
-    try:
-        content = uploaded_file.read().decode('utf-8')
-        data = json.loads(content)
+    """Restore coding progress from an uploaded JSON file.
 
+    The file is stream-parsed with ijson, so only one section (or one
+    decision validation) is materialized at a time.
+    """
+    try:
         # Extract metadata
-        metadata = data.get('metadata', {})
+        metadata = _read_json_section(uploaded_file, 'metadata', {})
         meeting_date = metadata.get('meeting_date')
         coder_id = metadata.get('coder_id')
 
         if not meeting_date or meeting_date not in TARGET_MEETINGS:
             return False, "Invalid or unsupported meeting date in file"
 
-        # Set the coder ID and meeting
-        st.session_state.coder_id = coder_id
-        st.session_state.selected_meeting = meeting_date
-
-        # Reset and restore decision validations
-        st.session_state.decision_validations = {}
-        for val in data.get('decision_validations', []):
+        # Stream decision validations one at a time
+        uploaded_file.seek(0)
+        decision_validations = {}
+        total = 0
+        for val in ijson.items(uploaded_file, 'decision_validations.item', use_float=True):
+            total += 1
             idx = val.get('decision_index')
             if idx is not None:
-                st.session_state.decision_validations[idx] = val
-
-        # Restore missing decisions
-        st.session_state.missing_decisions = data.get('missing_decisions', [])
+                decision_validations[idx] = Validation(
+                    **{k: v for k, v in val.items() if k in _VALIDATION_FIELDS}
+                )
 
-        # Restore meeting summary
-        st.session_state.meeting_summary = data.get('meeting_summary', {
+        missing_decisions = _read_json_section(uploaded_file, 'missing_decisions', [])
+        meeting_summary = _read_json_section(uploaded_file, 'meeting_summary', {
             'all_decisions_complete': False,
             'missing_check_complete': False,
             'overall_assessment': None,
             'general_notes': ''
         })
 
+        # Set the coder ID and meeting
+        st.session_state.coder_id = coder_id
+        st.session_state.selected_meeting = meeting_date
+
+        # Restore decision validations, missing decisions and meeting summary
+        st.session_state.decision_validations = decision_validations
+        st.session_state.missing_decisions = missing_decisions
+        st.session_state.meeting_summary = meeting_summary
+        clear_coding_widget_state()
+
         # Mark that we just restored so we can show progress info
         st.session_state.just_restored = True
 
-        completed = sum(1 for v in st.session_state.decision_validations.values() if v.get('completed', False))
-        total = len(data.get('decision_validations', []))
+        completed = sum(1 for v in decision_validations.values() if v.completed)
 
         return True, f"Restored progress: {completed}/{total} decisions completed"
 
-    except json.JSONDecodeError:
+    except ijson.JSONError:
         return False, "Invalid JSON file"
     except Exception as e:
         return False, f"Error loading file: {str(e)}"
 
 
+def _restore_progress(uploaded_file):
+    """Button callback: restore progress before the next run renders any widgets."""
+    st.session_state.restore_result = restore_from_uploaded_json(uploaded_file)
+
+
 def render_sidebar():
     """Render the sidebar with coder ID, meeting selection, and progress."""
     with st.sidebar:
@@ -200,45 +355,34 @@ def render_sidebar():
         )
 
         if uploaded_file is not None:
-            if st.button("📂 Restore Progress", use_container_width=True):
-                success, message = restore_from_uploaded_json(uploaded_file)
-                if success:
-                    st.success(message)
-                    st.rerun()
-                else:
-                    st.error(message)
+            st.button(
+                "📂 Restore Progress",
+                use_container_width=True,
+                on_click=_restore_progress,
+                args=(uploaded_file,)
+            )
+
+        restore_result = st.session_state.pop('restore_result', None)
+        if restore_result is not None:
+            success, message = restore_result
+            if success:
+                st.success(message)
+            else:
+                st.error(message)
 
         st.divider()
 
         st.header("Meeting Selection")
 
-        # Create meeting options
-        meeting_options = {
-            ymd: info['display_name']
-            for ymd, info in TARGET_MEETINGS.items()
-        }
-
-        # Calculate current index based on session state
-        current_index = None
-        if st.session_state.selected_meeting:
-            meeting_keys = list(meeting_options.keys())
-            if st.session_state.selected_meeting in meeting_keys:
-                current_index = meeting_keys.index(st.session_state.selected_meeting)
-
         selected_display = st.selectbox(
             "Select Meeting",
-            options=list(meeting_options.values()),
-            index=current_index,
+            options=_MEETING_DISPLAYS,
+            index=_MEETING_IDX_BY_YMD.get(st.session_state.selected_meeting),
             placeholder="Choose a meeting to validate..."
         )
 
         # Find the ymd for selected meeting
-        selected_ymd = None
-        if selected_display:
-            for ymd, display in meeting_options.items():
-                if display == selected_display:
-                    selected_ymd = ymd
-                    break
+        selected_ymd = _YMD_BY_DISPLAY.get(selected_display)
 
         # Handle meeting change (only reset if actually changing to a different meeting)
         if selected_ymd != st.session_state.selected_meeting:
@@ -249,138 +393,112 @@ def render_sidebar():
 
         st.divider()
 
-        # Progress tracker
-        if st.session_state.selected_meeting:
-            st.header("Progress")
 
-            decisions_df = load_decisions(st.session_state.selected_meeting)
-            if decisions_df is not None:
-                total_decisions = len(decisions_df)
-                completed = count_completed_decisions()
+def render_sidebar_progress(ctx: Optional[MeetingCtx], total_decisions: int, completed: int):
+    """Render the sidebar progress tracker and download buttons for the selected meeting."""
+    with st.sidebar:
+        # Progress tracker
+        st.header("Progress")
 
-                st.write(f"**Meeting:** {st.session_state.selected_meeting}")
-                st.write(f"**Decisions:** {completed} of {total_decisions} validated")
+        if ctx is not None:
+            st.write(f"**Meeting:** {ctx.ymd}")
+            st.write(f"**Decisions:** {completed} of {total_decisions} validated")
 
-                progress = completed / total_decisions if total_decisions > 0 else 0
-                st.progress(progress)
+            progress = completed / total_decisions if total_decisions > 0 else 0
+            st.progress(progress)
 
-                if completed == total_decisions:
-                    st.success("All decisions validated!")
+            if completed == total_decisions:
+                st.success("All decisions validated!")
+            else:
+                next_incomplete = find_first_incomplete_decision(total_decisions)
+                if next_incomplete >= 0:
+                    st.info(f"▶️ Next: **Decision {next_incomplete + 1}**")
                 else:
-                    next_incomplete = find_first_incomplete_decision(total_decisions)
-                    if next_incomplete >= 0:
-                        st.info(f"▶️ Next: **Decision {next_incomplete + 1}**")
-                    else:
-                        st.info("In Progress")
-
-            st.divider()
-
-            # Export buttons
-            st.header("Download Results")
-
-            if st.session_state.coder_id:
-                json_data, json_filename = generate_results_json()
-                csv_data, csv_filename = generate_results_csv()
-
-                if json_data:
-                    st.download_button(
-                        label="📥 Download JSON",
-                        data=json_data,
-                        file_name=json_filename,
-                        mime="application/json",
-                        use_container_width=True
-                    )
+                    st.info("In Progress")
 
-                if csv_data:
-                    st.download_button(
-                        label="📥 Download CSV",
-                        data=csv_data,
-                        file_name=csv_filename,
-                        mime="text/csv",
-                        use_container_width=True
-                    )
-            else:
-                st.info("Enter Coder ID to enable downloads")
+        st.divider()
 
+        # Export buttons
+        st.header("Download Results")
 
-def generate_results_json():
-    """Generate coding results as JSON string."""
-    ymd = st.session_state.selected_meeting
-    coder_id = st.session_state.coder_id
+        if st.session_state.coder_id:
+            if ctx is not None:
+                for fmt in _EXPORT_FORMATS:
+                    render_download_button(ctx, fmt, "sidebar")
+        else:
+            st.info("Enter Coder ID to enable downloads")
 
-    decisions_df = load_decisions(ymd)
-    if decisions_df is None:
-        return None, None
+
+def generate_results_json(ctx: MeetingCtx):
+    """Generate coding results as UTF-8 encoded JSON bytes."""
+    now = datetime.now()
 
     # Build decision validations list
     validations = []
-    for idx, row in decisions_df.iterrows():
-        val = get_validation_for_decision(idx).copy()
-        val['claude_description'] = row['description']
-        val['claude_type'] = row['type']
-        val['claude_score'] = int(row['score'])
-        val['claude_justification'] = row.get('justification', '')
+    records = ctx.decision_records
+    for rec, validation in zip(records, get_validations(len(records))):
+        val = asdict(validation)
+        val['claude_description'] = rec['description']
+        val['claude_type'] = rec['type']
+        val['claude_score'] = int(rec['score'])
+        val['claude_justification'] = rec['justification']
         validations.append(val)
 
-    # Get metadata
-    transcripts_df = load_transcripts_df()
-    stats = get_transcript_stats(ymd, transcripts_df)
-    alternatives = load_alternatives(ymd, load_alternatives_df())
-
     output = {
         "metadata": {
-            "meeting_date": ymd,
-            "coder_id": coder_id,
-            "coding_timestamp": datetime.now().isoformat(),
+            "meeting_date": ctx.ymd,
+            "coder_id": st.session_state.coder_id,
+            "coding_timestamp": now.isoformat(),
             "app_version": "1.0",
-            "transcript_word_count": stats['word_count'],
-            "num_decisions_claude": len(decisions_df),
-            "alternatives_available": len(alternatives) > 0
+            "transcript_word_count": ctx.stats['word_count'],
+            "num_decisions_claude": len(ctx.decision_records),
+            "alternatives_available": len(ctx.alternatives) > 0
         },
         "decision_validations": validations,
         "missing_decisions": st.session_state.missing_decisions,
         "meeting_summary": st.session_state.meeting_summary
     }
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"decisions_{ymd}_{coder_id}_{timestamp}.json"
+    filename = get_results_filename(ctx.ymd, st.session_state.coder_id, "json", now)
 
-    return json.dumps(output, indent=2, ensure_ascii=False), filename
+    json_bytes = orjson.dumps(
+        output,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+    return json_bytes, filename
 
 
-def generate_results_csv():
+def generate_results_csv(ctx: MeetingCtx):
     """Generate coding results as CSV string."""
-    ymd = st.session_state.selected_meeting
+    ymd = ctx.ymd
     coder_id = st.session_state.coder_id
-
-    decisions_df = load_decisions(ymd)
-    if decisions_df is None:
-        return None, None
+    now = datetime.now()
+    now_iso = now.isoformat()
 
     rows = []
 
     # Add validated decisions
-    for idx, row in decisions_df.iterrows():
-        val = get_validation_for_decision(idx)
+    records = ctx.decision_records
+    for rec, val in zip(records, get_validations(len(records))):
         csv_row = {
             "meeting_date": ymd,
             "coder_id": coder_id,
-            "coding_timestamp": datetime.now().isoformat(),
+            "coding_timestamp": now_iso,
             "record_type": "validated_decision",
-            "decision_index": val.get("decision_index"),
-            "claude_description": row['description'],
-            "claude_type": row['type'],
-            "claude_score": int(row['score']),
-            "claude_justification": row.get('justification', ''),
-            "human_occurred": val.get("human_occurred"),
-            "human_corrected_description": val.get("human_corrected_description"),
-            "human_type_agree": val.get("human_type_agree"),
-            "human_type_override": val.get("human_type_override"),
-            "human_score": val.get("human_score"),
-            "human_evidence": val.get("human_evidence"),
-            "human_notes": val.get("human_notes"),
-            "human_confidence": val.get("human_confidence"),
-            "completed": val.get("completed")
+            "decision_index": val.decision_index,
+            "claude_description": rec['description'],
+            "claude_type": rec['type'],
+            "claude_score": int(rec['score']),
+            "claude_justification": rec['justification'],
+            "human_occurred": val.human_occurred,
+            "human_corrected_description": val.human_corrected_description,
+            "human_type_agree": val.human_type_agree,
+            "human_type_override": val.human_type_override,
+            "human_score": val.human_score,
+            "human_evidence": val.human_evidence,
+            "human_notes": val.human_notes,
+            "human_confidence": val.human_confidence,
+            "completed": val.completed
         }
         rows.append(csv_row)
 
@@ -389,7 +507,7 @@ def generate_results_csv():
         csv_row = {
             "meeting_date": ymd,
             "coder_id": coder_id,
-            "coding_timestamp": datetime.now().isoformat(),
+            "coding_timestamp": now_iso,
             "record_type": "missing_decision",
             "decision_index": f"missing_{i+1}",
             "claude_description": None,
@@ -412,7 +530,7 @@ def generate_results_csv():
     summary_row = {
         "meeting_date": ymd,
         "coder_id": coder_id,
-        "coding_timestamp": datetime.now().isoformat(),
+        "coding_timestamp": now_iso,
         "record_type": "meeting_summary",
         "decision_index": None,
         "claude_description": None,
@@ -431,19 +549,79 @@ def generate_results_csv():
     }
     rows.append(summary_row)
 
-    df = pd.DataFrame(rows)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"decisions_{ymd}_{coder_id}_{timestamp}.csv"
+    filename = get_results_filename(ymd, coder_id, "csv", now)
+    return _write_csv(rows), filename
+
+
+def _write_csv(rows: list) -> str:
+    """Write row dicts as CSV text, formatted the way pd.DataFrame(rows).to_csv() would."""
+    fieldnames = list(rows[0].keys())
+
+    # pandas stores a numeric column holding blanks or floats as float64 and
+    # writes it as e.g. "-3.0"; convert those columns so the output matches
+    # utils.export.export_to_csv and earlier downloads
+    float_fields = []
+    for field in fieldnames:
+        values = [row[field] for row in rows]
+        numbers = [v for v in values if v is not None]
+        if (numbers and all(type(v) in (int, float) for v in numbers)
+                and (len(numbers) < len(values) or any(type(v) is float for v in numbers))):
+            float_fields.append(field)
+
+    if float_fields:
+        rows = [
+            {**row, **{f: float(row[f]) for f in float_fields if row[f] is not None}}
+            for row in rows
+        ]
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
 
-    return df.to_csv(index=False), filename
 
+# Download formats: label, MIME type and generator for each
+_EXPORT_FORMATS = {
+    'json': ("JSON", "application/json", generate_results_json),
+    'csv': ("CSV", "text/csv", generate_results_csv)
+}
 
-def render_meeting_overview(ymd: str, decisions_df: pd.DataFrame):
+
+def _prepare_download(location: str, fmt: str):
+    """Button callback: choose which format to generate for a download area."""
+    st.session_state[f"pending_export_{location}"] = fmt
+
+
+def render_download_button(ctx: MeetingCtx, fmt: str, location: str, button_type: str = "secondary"):
+    """Render a download button, generating its payload only once the user asks for that format."""
+    label, mime, generate = _EXPORT_FORMATS[fmt]
+
+    if st.session_state.get(f"pending_export_{location}") == fmt:
+        data, filename = generate(ctx)
+        st.download_button(
+            label=f"📥 Download {label}",
+            data=data,
+            file_name=filename,
+            mime=mime,
+            key=f"download_{fmt}_{location}",
+            use_container_width=True,
+            type=button_type
+        )
+    else:
+        st.button(
+            f"Prepare {label}",
+            key=f"prepare_{fmt}_{location}",
+            on_click=_prepare_download,
+            args=(location, fmt),
+            use_container_width=True,
+            type=button_type
+        )
+
+
+def render_meeting_overview(ctx: MeetingCtx):
     """Render the meeting overview section."""
-    meeting_info = TARGET_MEETINGS[ymd]
-    transcripts_df = load_transcripts_df()
-    stats = get_transcript_stats(ymd, transcripts_df)
-    alternatives = load_alternatives(ymd, load_alternatives_df())
+    meeting_info = TARGET_MEETINGS[ctx.ymd]
 
     st.markdown("---")
     st.header(f"MEETING: {meeting_info['display_name']}")
@@ -452,29 +630,26 @@ def render_meeting_overview(ymd: str, decisions_df: pd.DataFrame):
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.metric("Decisions Identified", len(decisions_df))
+        st.metric("Decisions Identified", len(ctx.decisions_df))
 
     with col2:
-        st.metric("Transcript Length", f"~{stats['word_count']:,} words")
+        st.metric("Transcript Length", f"~{ctx.stats['word_count']:,} words")
 
     with col3:
-        alt_status = f"Yes ({len(alternatives)})" if alternatives else "No"
+        alt_status = f"Yes ({len(ctx.alternatives)})" if ctx.alternatives else "No"
         st.metric("Policy Alternatives", alt_status)
 
 
-def render_alternatives_section(ymd: str):
+def render_alternatives_section(ctx: MeetingCtx):
     """Render the policy alternatives expander."""
-    alternatives_df = load_alternatives_df()
-    alternatives = load_alternatives(ymd, alternatives_df)
-
     with st.expander("📋 View Policy Alternatives", expanded=False):
-        if not alternatives:
+        if not ctx.alternatives:
             st.info(
                 "No policy alternatives data available for this meeting.\n\n"
                 "(This was an emergency meeting with a non-standard format.)"
             )
         else:
-            for alt in alternatives:
+            for alt in ctx.alternatives:
                 st.markdown("---")
                 st.subheader(alt['label'])
 
@@ -492,10 +667,13 @@ def render_alternatives_section(ymd: str):
                     )
 
 
-def render_transcript_section(ymd: str):
-    """Render the transcript viewer expander."""
-    transcripts_df = load_transcripts_df()
+def _change_transcript_page(page: int):
+    """Button callback: switch the transcript viewer to another page."""
+    st.session_state.transcript_page = page
+
 
+def render_transcript_section(ctx: MeetingCtx):
+    """Render the transcript viewer expander."""
     with st.expander("📄 View Full Transcript", expanded=False):
         # Search functionality
         search_term = st.text_input(
@@ -504,38 +682,79 @@ def render_transcript_section(ymd: str):
             key="transcript_search"
         )
 
-        transcript_text = load_transcript(ymd, transcripts_df)
-
-        if search_term:
-            results = search_transcript(transcript_text, search_term)
+        if search_term and len(search_term) < _MIN_SEARCH_LENGTH:
+            st.caption(f"Enter at least {_MIN_SEARCH_LENGTH} characters to search.")
+        elif search_term:
+            results = search_transcript(_cached_transcript_lines(ctx.ymd), search_term)
             st.write(f"Found {len(results)} matches for '{search_term}'")
 
             if results:
+                # Highlight the search term (case-insensitive)
+                pattern = re.compile(re.escape(search_term), re.IGNORECASE)
                 for result in results[:50]:  # Limit to first 50 results
-                    # Highlight the search term
-                    highlighted = result['text'].replace(
-                        search_term,
-                        f"**{search_term}**"
-                    )
+                    highlighted = pattern.sub(lambda m: f"**{m.group(0)}**", result['text'])
                     st.markdown(f"---\n{highlighted}")
         else:
-            # Show full transcript in scrollable container
+            # Show one page of the transcript at a time
+            pages = _cached_transcript_pages(ctx.ymd)
+            page = min(st.session_state.transcript_page, len(pages) - 1)
+
+            col1, col2, col3 = st.columns([1, 4, 1])
+            with col1:
+                st.button(
+                    "◀ Prev",
+                    key="transcript_prev",
+                    disabled=page == 0,
+                    on_click=_change_transcript_page,
+                    args=(page - 1,)
+                )
+            with col2:
+                st.caption(f"Page {page + 1} of {len(pages)}")
+            with col3:
+                st.button(
+                    "Next ▶",
+                    key="transcript_next",
+                    disabled=page == len(pages) - 1,
+                    on_click=_change_transcript_page,
+                    args=(page + 1,)
+                )
+
             st.text_area(
                 "Full Transcript",
-                value=transcript_text,
+                value=pages[page],
                 height=500,
                 disabled=True,
                 label_visibility="collapsed"
             )
 
 
-def render_decision_validation(idx: int, row: pd.Series, total_decisions: int):
+def _mark_decision_complete(idx: int):
+    """Button callback: mark a decision complete if its required fields are filled in."""
+    validation = get_validation_for_decision(idx)
+
+    # Validate required fields
+    if validation.human_occurred is None:
+        st.session_state[f"complete_error_{idx}"] = "Please indicate if this decision occurred"
+    elif validation.human_confidence is None:
+        st.session_state[f"complete_error_{idx}"] = "Please select a confidence level"
+    else:
+        validation.completed = True
+
+
+def _clear_decision(idx: int):
+    """Button callback: discard all responses for a decision."""
+    st.session_state.decision_validations[idx] = Validation(decision_index=idx)
+    for name in _DECISION_WIDGET_NAMES:
+        st.session_state.pop(f"{name}_{idx}", None)
+
+
+def render_decision_validation(idx: int, row: tuple, total_decisions: int):
     """Render validation form for a single decision."""
     validation = get_validation_for_decision(idx)
 
     # Decision header
     st.markdown("---")
-    status_icon = "✅" if validation.get('completed') else "⬜"
+    status_icon = "✅" if validation.completed else "⬜"
     st.subheader(f"{status_icon} Decision {idx + 1} of {total_decisions}")
 
     # Claude's extraction
@@ -543,174 +762,209 @@ def render_decision_validation(idx: int, row: pd.Series, total_decisions: int):
 
     with st.container():
         st.markdown("**Description:**")
-        st.info(row['description'])
+        st.info(row.description)
 
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown(f"**Type:** `{row['type']}`")
+            st.markdown(f"**Type:** `{row.type}`")
         with col2:
-            score = int(row['score'])
+            score = int(row.score)
             score_label = SCORE_SCALE.get(score, "Unknown")
             st.markdown(f"**Score:** `{score}` ({score_label})")
 
-        if pd.notna(row.get('justification')):
+        if pd.notna(row.justification):
             st.markdown("**Justification:**")
-            st.caption(row['justification'])
+            st.caption(row.justification)
 
     st.markdown("#### Your Validation")
 
+    # Widgets own their values once seeded from the stored validation
+    agree_label = f"Agree: {row.type}"
+    claude_score = int(row.score)
+    st.session_state.setdefault(f"occurred_{idx}", OCCURRENCE_OPTIONS.get(validation.human_occurred))
+    st.session_state.setdefault(
+        f"type_agree_{idx}", "Disagree" if validation.human_type_agree is False else agree_label
+    )
+    st.session_state.setdefault(
+        f"score_{idx}", claude_score if validation.human_score is None else validation.human_score
+    )
+    st.session_state.setdefault(f"evidence_{idx}", validation.human_evidence)
+    st.session_state.setdefault(f"notes_{idx}", validation.human_notes)
+    st.session_state.setdefault(f"confidence_{idx}", _CONFIDENCE_LABEL_BY_LEVEL.get(validation.human_confidence))
+    # Conditional widgets are seeded only when shown (see below): a key seeded
+    # while its widget is hidden would be restored stale once Streamlit drops it
+
     # 1. Did this decision occur?
     st.markdown("**1. Did this decision occur at this meeting?**")
 
-    occurred_options = list(OCCURRENCE_OPTIONS.values())
-    occurred_keys = list(OCCURRENCE_OPTIONS.keys())
-
-    current_occurred_idx = None
-    if validation.get('human_occurred') in occurred_keys:
-        current_occurred_idx = occurred_keys.index(validation['human_occurred'])
-
     occurred_selection = st.radio(
         f"Occurred_{idx}",
-        options=occurred_options,
-        index=current_occurred_idx,
+        options=_OCCURRED_LABELS,
         key=f"occurred_{idx}",
         label_visibility="collapsed"
     )
 
     if occurred_selection:
-        validation['human_occurred'] = occurred_keys[occurred_options.index(occurred_selection)]
+        _update_field(validation, 'human_occurred', _OCCURRED_KEY_BY_LABEL[occurred_selection])
 
     # Show correction field if needed
-    if validation.get('human_occurred') == 'yes_corrected':
-        validation['human_corrected_description'] = st.text_area(
+    if validation.human_occurred == 'yes_corrected':
+        st.session_state.setdefault(f"corrected_desc_{idx}", validation.human_corrected_description or '')
+        corrected_description = st.text_area(
             "Corrected description",
-            value=validation.get('human_corrected_description', ''),
             key=f"corrected_desc_{idx}",
             placeholder="Enter the corrected description..."
         )
+        _update_field(validation, 'human_corrected_description', corrected_description)
 
     # 2. Type classification
     st.markdown("**2. Type classification:**")
 
     type_agree = st.radio(
         f"Type agreement_{idx}",
-        options=[f"Agree: {row['type']}", "Disagree"],
-        index=0 if validation.get('human_type_agree', True) else 1,
+        options=[agree_label, "Disagree"],
         key=f"type_agree_{idx}",
         label_visibility="collapsed"
     )
 
-    validation['human_type_agree'] = type_agree.startswith("Agree")
+    _update_field(validation, 'human_type_agree', type_agree.startswith("Agree"))
 
-    if not validation['human_type_agree']:
-        validation['human_type_override'] = st.selectbox(
+    if not validation.human_type_agree:
+        st.session_state.setdefault(f"type_override_{idx}", validation.human_type_override or DECISION_TYPES[0])
+        type_override = st.selectbox(
             "Should be:",
             options=DECISION_TYPES,
             key=f"type_override_{idx}"
         )
     else:
-        validation['human_type_override'] = None
+        type_override = None
+    _update_field(validation, 'human_type_override', type_override)
 
     # 3. Policy stance score
     st.markdown("**3. Policy stance score:**")
 
-    st.caption(f"Claude's score: **{int(row['score'])}**")
+    st.caption(f"Claude's score: **{claude_score}**")
 
     # Score reference
     with st.expander("Score scale reference", expanded=False):
         for score_val, score_desc in SCORE_SCALE.items():
             st.write(f"`{score_val:+d}`: {score_desc}")
 
-    current_score = validation.get('human_score')
-    if current_score is None:
-        current_score = int(row['score'])
-
-    validation['human_score'] = st.slider(
+    human_score = st.slider(
         "Your score",
         min_value=-3,
         max_value=3,
-        value=current_score,
         key=f"score_{idx}",
         format="%+d"
     )
+    _update_field(validation, 'human_score', human_score)
 
     # 4. Evidence location
     st.markdown("**4. Evidence location:**")
-    validation['human_evidence'] = st.text_area(
+    human_evidence = st.text_area(
         "Where in the transcript is this decision documented?",
-        value=validation.get('human_evidence', ''),
         key=f"evidence_{idx}",
         placeholder="Paste relevant excerpt or describe location...",
         label_visibility="collapsed"
     )
+    _update_field(validation, 'human_evidence', human_evidence)
 
     # 5. Notes
     st.markdown("**5. Notes (optional):**")
-    validation['human_notes'] = st.text_area(
+    human_notes = st.text_area(
         "Any concerns, ambiguities, etc.",
-        value=validation.get('human_notes', ''),
         key=f"notes_{idx}",
         placeholder="Optional notes...",
         label_visibility="collapsed"
     )
+    _update_field(validation, 'human_notes', human_notes)
 
     # 6. Confidence
     st.markdown("**6. Confidence:**")
 
-    confidence_idx = None
-    if validation.get('human_confidence') in CONFIDENCE_LEVELS:
-        confidence_idx = CONFIDENCE_LEVELS.index(validation['human_confidence'])
-
     confidence_selection = st.radio(
         f"Confidence_{idx}",
-        options=["High confidence", "Medium confidence", "Low confidence / uncertain"],
-        index=confidence_idx,
+        options=_CONFIDENCE_LABELS,
         key=f"confidence_{idx}",
         label_visibility="collapsed",
         horizontal=True
     )
 
     if confidence_selection:
-        validation['human_confidence'] = CONFIDENCE_LEVELS[
-            ["High confidence", "Medium confidence", "Low confidence / uncertain"].index(confidence_selection)
-        ]
+        _update_field(
+            validation, 'human_confidence', CONFIDENCE_LEVELS[_CONFIDENCE_IDX[confidence_selection]]
+        )
 
     # Mark complete button
     col1, col2 = st.columns([1, 4])
     with col1:
-        if st.button(
-            "✓ Mark Complete" if not validation.get('completed') else "✓ Completed",
+        st.button(
+            "✓ Mark Complete" if not validation.completed else "✓ Completed",
             key=f"complete_{idx}",
-            type="primary" if not validation.get('completed') else "secondary"
-        ):
-            # Validate required fields
-            if validation.get('human_occurred') is None:
-                st.error("Please indicate if this decision occurred")
-            elif validation.get('human_confidence') is None:
-                st.error("Please select a confidence level")
-            else:
-                validation['completed'] = True
-                st.success("Decision marked as complete!")
-                st.rerun()
+            type="primary" if not validation.completed else "secondary",
+            on_click=_mark_decision_complete,
+            args=(idx,)
+        )
 
     with col2:
-        if st.button("Clear Responses", key=f"clear_{idx}"):
-            st.session_state.decision_validations[idx] = {
-                'decision_index': idx,
-                'human_occurred': None,
-                'human_corrected_description': None,
-                'human_type_agree': None,
-                'human_type_override': None,
-                'human_score': None,
-                'human_evidence': '',
-                'human_notes': '',
-                'human_confidence': None,
-                'completed': False
-            }
-            st.rerun()
-
-    # Update session state
-    st.session_state.decision_validations[idx] = validation
+        st.button("Clear Responses", key=f"clear_{idx}", on_click=_clear_decision, args=(idx,))
+
+    completion_error = st.session_state.pop(f"complete_error_{idx}", None)
+    if completion_error:
+        st.error(completion_error)
+
+
+def _focus_decision(idx: int):
+    """Button callback: open the validation form for a decision."""
+    st.session_state.focused_decision = idx
+
+
+def render_decision_list(decisions_df: pd.DataFrame):
+    """Render the full form for the focused decision and a one-line stub for the rest."""
+    total_decisions = len(decisions_df)
+    focused = st.session_state.focused_decision
+
+    for idx, row in enumerate(decisions_df.itertuples(index=False)):
+        if idx == focused:
+            with st.container(border=True):
+                render_decision_validation(idx, row, total_decisions)
+
+                if idx + 1 < total_decisions:
+                    st.button(
+                        "Go to next decision ▶",
+                        key=f"next_decision_{idx}",
+                        on_click=_focus_decision,
+                        args=(idx + 1,)
+                    )
+        else:
+            status_icon = "✅" if get_validation_for_decision(idx).completed else "⬜"
+            description = str(row.description) if pd.notna(row.description) else ""
+            if len(description) > 90:
+                description = description[:90] + "..."
+            st.button(
+                f"{status_icon} Decision {idx + 1}: {description}",
+                key=f"focus_decision_{idx}",
+                on_click=_focus_decision,
+                args=(idx,),
+                use_container_width=True
+            )
+
+
+def _add_missing_decision():
+    """Button callback: append a blank missing decision."""
+    st.session_state.missing_decisions.append({
+        'description': '',
+        'type': 'other',
+        'score': 0,
+        'evidence': ''
+    })
+
+
+def _remove_missing_decision(i: int):
+    """Button callback: remove a missing decision before the list is rendered."""
+    st.session_state.missing_decisions.pop(i)
+    # Widget keys are positional, so re-seed every remaining entry
+    clear_missing_widget_state()
 
 
 def render_missing_decisions_section():
@@ -724,22 +978,30 @@ def render_missing_decisions_section():
         "Claude did **NOT** identify?"
     )
 
+    st.session_state.setdefault(
+        "has_missing_decisions",
+        _HAS_MISSING_OPTIONS[1] if st.session_state.missing_decisions else _HAS_MISSING_OPTIONS[0]
+    )
     has_missing = st.radio(
         "Missing decisions check",
-        options=["No, Claude captured all major decisions", "Yes, there are missing decisions"],
+        options=_HAS_MISSING_OPTIONS,
         key="has_missing_decisions",
         label_visibility="collapsed"
     )
 
-    if has_missing == "Yes, there are missing decisions":
+    if has_missing == _HAS_MISSING_OPTIONS[1]:
         st.markdown("### Add Missing Decisions")
 
         # Show existing missing decisions
         for i, missing in enumerate(st.session_state.missing_decisions):
+            st.session_state.setdefault(f"missing_desc_{i}", missing.get('description', ''))
+            st.session_state.setdefault(f"missing_type_{i}", missing.get('type', 'other'))
+            st.session_state.setdefault(f"missing_score_{i}", missing.get('score', 0))
+            st.session_state.setdefault(f"missing_evidence_{i}", missing.get('evidence', ''))
+
             with st.expander(f"Missing Decision #{i+1}", expanded=True):
                 missing['description'] = st.text_area(
                     "Description",
-                    value=missing.get('description', ''),
                     key=f"missing_desc_{i}"
                 )
                 missing['type'] = st.selectbox(
@@ -751,41 +1013,33 @@ def render_missing_decisions_section():
                     "Your score",
                     min_value=-3,
                     max_value=3,
-                    value=missing.get('score', 0),
                     key=f"missing_score_{i}",
                     format="%+d"
                 )
                 missing['evidence'] = st.text_area(
                     "Evidence",
-                    value=missing.get('evidence', ''),
                     key=f"missing_evidence_{i}"
                 )
 
-                if st.button(f"Remove Missing Decision #{i+1}", key=f"remove_missing_{i}"):
-                    st.session_state.missing_decisions.pop(i)
-                    st.rerun()
+                st.button(
+                    f"Remove Missing Decision #{i+1}",
+                    key=f"remove_missing_{i}",
+                    on_click=_remove_missing_decision,
+                    args=(i,)
+                )
 
         # Add new missing decision button
-        if st.button("+ Add Another Missing Decision"):
-            st.session_state.missing_decisions.append({
-                'description': '',
-                'type': 'other',
-                'score': 0,
-                'evidence': ''
-            })
-            st.rerun()
+        st.button("+ Add Another Missing Decision", on_click=_add_missing_decision)
 
     st.session_state.meeting_summary['missing_check_complete'] = True
 
 
-def render_meeting_summary_section(decisions_df: pd.DataFrame):
+def render_meeting_summary_section(ctx: MeetingCtx, total: int, completed: int):
     """Render the meeting-level summary section."""
     st.markdown("---")
     st.header("Meeting Validation Summary")
     st.markdown("---")
 
-    total = len(decisions_df)
-    completed = count_completed_decisions()
     missing_count = len(st.session_state.missing_decisions)
 
     col1, col2 = st.columns(2)
@@ -796,32 +1050,25 @@ def render_meeting_summary_section(decisions_df: pd.DataFrame):
 
     st.markdown("**Overall assessment of Claude's decision extraction for this meeting:**")
 
-    assessment_options = list(ASSESSMENT_OPTIONS.values())
-    assessment_keys = list(ASSESSMENT_OPTIONS.keys())
-
-    current_assessment_idx = None
-    if st.session_state.meeting_summary.get('overall_assessment') in assessment_keys:
-        current_assessment_idx = assessment_keys.index(
-            st.session_state.meeting_summary['overall_assessment']
-        )
+    st.session_state.setdefault(
+        "overall_assessment",
+        ASSESSMENT_OPTIONS.get(st.session_state.meeting_summary.get('overall_assessment'))
+    )
+    st.session_state.setdefault("general_notes", st.session_state.meeting_summary.get('general_notes', ''))
 
     assessment_selection = st.radio(
         "Overall assessment",
-        options=assessment_options,
-        index=current_assessment_idx,
+        options=_ASSESSMENT_LABELS,
         key="overall_assessment",
         label_visibility="collapsed"
     )
 
     if assessment_selection:
-        st.session_state.meeting_summary['overall_assessment'] = assessment_keys[
-            assessment_options.index(assessment_selection)
-        ]
+        st.session_state.meeting_summary['overall_assessment'] = _ASSESSMENT_KEY_BY_LABEL[assessment_selection]
 
     st.markdown("**General notes on this meeting's coding:**")
     st.session_state.meeting_summary['general_notes'] = st.text_area(
         "General notes",
-        value=st.session_state.meeting_summary.get('general_notes', ''),
         key="general_notes",
         placeholder="Any overall observations about the coding quality...",
         label_visibility="collapsed"
@@ -849,32 +1096,9 @@ def render_meeting_summary_section(decisions_df: pd.DataFrame):
     if ready_to_submit:
         st.success("✅ All validations complete! Download your results below:")
 
-        json_data, json_filename = generate_results_json()
-        csv_data, csv_filename = generate_results_csv()
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            if json_data:
-                st.download_button(
-                    label="📥 Download JSON",
-                    data=json_data,
-                    file_name=json_filename,
-                    mime="application/json",
-                    use_container_width=True,
-                    type="primary"
-                )
-
-        with col2:
-            if csv_data:
-                st.download_button(
-                    label="📥 Download CSV",
-                    data=csv_data,
-                    file_name=csv_filename,
-                    mime="text/csv",
-                    use_container_width=True,
-                    type="primary"
-                )
+        for col, fmt in zip(st.columns(2), _EXPORT_FORMATS):
+            with col:
+                render_download_button(ctx, fmt, "summary", button_type="primary")
 
         st.balloons()
 
@@ -889,77 +1113,79 @@ def main():
     # Render sidebar
     render_sidebar()
 
+    # Load data for the selected meeting once per rerun
+    ymd = st.session_state.selected_meeting
+    ctx = build_meeting_ctx(ymd) if ymd else None
+
+    # Progress counts (completion only changes in callbacks, before this point)
+    total = len(ctx.decisions_df) if ctx is not None else 0
+    completed = count_completed_decisions()
+
+    if ymd:
+        render_sidebar_progress(ctx, total, completed)
+
     # Main content
     if not st.session_state.coder_id:
         st.warning("Please enter your Coder ID in the sidebar to begin.")
         return
 
-    if not st.session_state.selected_meeting:
+    if not ymd:
         st.info("Please select a meeting from the sidebar to begin validation.")
 
         # Show overview of target meetings
         st.markdown("### Available Meetings for Validation")
 
-        for ymd, info in TARGET_MEETINGS.items():
-            decisions_df = load_decisions(ymd)
-            n_decisions = len(decisions_df) if decisions_df is not None else "?"
+        overview = []
+        for meeting_ymd, info in TARGET_MEETINGS.items():
+            n_decisions = get_decision_count(meeting_ymd)
             alt_status = "Yes" if info['has_alternatives'] else "No"
 
-            st.markdown(
+            overview.append(
                 f"- **{info['display_name']}**\n"
                 f"  - Era: {info['era']}\n"
-                f"  - Decisions: {n_decisions}\n"
+                f"  - Decisions: {n_decisions if n_decisions is not None else '?'}\n"
                 f"  - Alternatives available: {alt_status}"
             )
+        st.markdown("\n".join(overview))
         return
 
-    # Load data for selected meeting
-    ymd = st.session_state.selected_meeting
-    decisions_df = load_decisions(ymd)
-
-    if decisions_df is None:
+    if ctx is None:
         st.error(f"Could not load decisions for meeting {ymd}")
         return
 
+    decisions_df = ctx.decisions_df
+
     # Show toast notification after restore
     if st.session_state.just_restored:
         st.session_state.just_restored = False
-        completed = count_completed_decisions()
-        total = len(decisions_df)
         next_incomplete = find_first_incomplete_decision(total)
+        st.session_state.focused_decision = max(next_incomplete, 0)
         if next_incomplete >= 0:
             st.toast(f"Restored! {completed}/{total} done. Continue with Decision {next_incomplete + 1}", icon="📂")
         else:
             st.toast(f"Restored! All {total} decisions completed.", icon="✅")
 
     # Render meeting overview
-    render_meeting_overview(ymd, decisions_df)
+    render_meeting_overview(ctx)
 
     # Render policy alternatives
-    render_alternatives_section(ymd)
+    render_alternatives_section(ctx)
 
     # Render transcript viewer
-    render_transcript_section(ymd)
+    render_transcript_section(ctx)
 
     # Render decision validations
     st.markdown("---")
     st.header("Decision-by-Decision Validation")
 
-    # Use tabs for decisions
-    decision_tabs = st.tabs([
-        f"Decision {i+1}" + (" ✓" if get_validation_for_decision(i).get('completed') else "")
-        for i in range(len(decisions_df))
-    ])
-
-    for idx, (tab, (_, row)) in enumerate(zip(decision_tabs, decisions_df.iterrows())):
-        with tab:
-            render_decision_validation(idx, row, len(decisions_df))
+    # Only the focused decision gets its full form; the rest are one-line stubs
+    render_decision_list(decisions_df)
 
     # Render missing decisions section
     render_missing_decisions_section()
 
     # Render meeting summary
-    render_meeting_summary_section(decisions_df)
+    render_meeting_summary_section(ctx, total, completed)
 
 
 if __name__ == "__main__":
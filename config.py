@@ -48,6 +48,9 @@ DATA_PATHS = {
     "results_dir": "data/coding_results/"
 }
 
+# Approximate number of words per page in the transcript viewer
+TRANSCRIPT_PAGE_WORDS = 3000
+
 # Decision occurrence options
 OCCURRENCE_OPTIONS = {
     "yes_exact": "Yes, exactly as described",
@@ -1,3 +1,3 @@
 # Utils package for FOMC Decision Validation Tool
-from .data_loader import load_transcripts_df, load_alternatives_df, load_transcript, load_alternatives, load_decisions
+from .data_loader import load_transcripts_df, load_target_transcripts, load_meeting_transcript_df, load_alternatives_df, load_alternatives_by_meeting, load_transcript, load_alternatives, load_decisions
 from .export import save_coding_results, export_to_csv, load_existing_results
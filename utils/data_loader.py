@@ -1,120 +1,249 @@
 """
 Data loading utilities for FOMC Decision Validation Tool.
 """
+import numpy as np
 import pandas as pd
-import pickle
+import re
 from pathlib import Path
 from typing import List, Dict, Optional
 import streamlit as st
 
-from config import DATA_PATHS
+from config import DATA_PATHS, TARGET_MEETINGS
 
+# Titles that are written without a trailing period in speaker labels
+_CHAIR_TITLES = ['CHAIR', 'CHAIRMAN', 'VICE CHAIR', 'VICE CHAIRMAN']
 
-@st.cache_data
+# Transcript columns needed to rebuild and summarize a meeting
+_TRANSCRIPT_COLUMNS = ['ymd', 'n', 'titletidy', 'stablespeaker', 'combined', 'words']
+
+# Decision columns used by the app
+_DECISION_COLUMNS = ['description', 'type', 'score', 'justification']
+
+
+@st.cache_resource
 def load_transcripts_df() -> pd.DataFrame:
     """
     Load the full transcripts DataFrame from parquet file.
-    Cached to avoid reloading on each Streamlit rerun.
+    Cached as a shared read-only object to avoid reloading or copying it
+    on each Streamlit rerun; callers must not mutate it.
     """
     return pd.read_parquet(DATA_PATHS["transcripts"])
 
 
-@st.cache_data
+@st.cache_resource
+def load_target_transcripts() -> Dict[str, pd.DataFrame]:
+    """
+    Load transcript rows for all target meetings, grouped by meeting.
+
+    The ymd filter and column list are pushed down to pyarrow, so only the
+    columns needed for display are decoded and only target meeting rows
+    are materialized. Rows are sorted once here so per-meeting lookups are
+    a dict hit on an already ordered frame.
+
+    Returns:
+        Dict mapping ymd to that meeting's transcript rows, sorted by 'n'.
+    """
+    transcripts_df = pd.read_parquet(
+        DATA_PATHS["transcripts"],
+        columns=_TRANSCRIPT_COLUMNS,
+        filters=[('ymd', 'in', list(TARGET_MEETINGS))]
+    ).sort_values(['ymd', 'n'])
+    return {ymd: group for ymd, group in transcripts_df.groupby('ymd', sort=False)}
+
+
+@st.cache_resource
+def load_meeting_transcript_df(ymd: str) -> pd.DataFrame:
+    """
+    Load a single meeting's transcript rows.
+
+    Target meetings come from load_target_transcripts(); any other meeting
+    is read directly with the same filter pushdown. Cached as a shared
+    read-only object so hits are not copied; callers must not mutate it.
+
+    Args:
+        ymd: Meeting date as string
+
+    Returns:
+        Transcript rows for the meeting sorted by 'n' (empty if none exist).
+    """
+    target_transcripts = load_target_transcripts()
+    if ymd in target_transcripts:
+        return target_transcripts[ymd]
+
+    return pd.read_parquet(
+        DATA_PATHS["transcripts"],
+        columns=_TRANSCRIPT_COLUMNS,
+        filters=[('ymd', '==', ymd)]
+    ).sort_values('n')
+
+
+@st.cache_resource
 def load_alternatives_df() -> pd.DataFrame:
     """
     Load the full alternatives DataFrame from pickle file.
-    Cached to avoid reloading on each Streamlit rerun.
+    Cached as a shared read-only object to avoid reloading or copying it
+    on each Streamlit rerun; callers must not mutate it.
     """
-    with open(DATA_PATHS["alternatives"], 'rb') as f:
-        return pickle.load(f)
+    return pd.read_pickle(DATA_PATHS["alternatives"])
 
 
-def load_transcript(ymd: str, transcripts_df: pd.DataFrame) -> str:
+def load_transcript(ymd: str, transcripts_df: Optional[pd.DataFrame] = None) -> str:
     """
     Filter transcripts DataFrame to a single meeting and reconstruct full text.
 
     Args:
         ymd: Meeting date as string (e.g., "20100127")
-        transcripts_df: Full transcripts DataFrame
+        transcripts_df: Full transcripts DataFrame. When omitted, the cached
+            per-meeting result is returned.
 
     Returns:
         Formatted string with speaker labels and their utterances.
     """
-    meeting_df = transcripts_df[transcripts_df['ymd'] == ymd].sort_values('n')
+    if transcripts_df is None:
+        return _load_transcript_cached(ymd)
+    return _build_transcript(ymd, transcripts_df[transcripts_df['ymd'] == ymd].sort_values('n'))
+
+
+@st.cache_data
+def _load_transcript_cached(ymd: str) -> str:
+    """
+    Reconstruct a meeting's transcript text, cached per meeting.
+
+    Args:
+        ymd: Meeting date as string
+
+    Returns:
+        Formatted transcript string (see load_transcript).
+    """
+    return _build_transcript(ymd, load_meeting_transcript_df(ymd))
+
+
+def _build_transcript(ymd: str, meeting_df: pd.DataFrame) -> str:
+    """
+    Join a meeting's formatted utterances into the full transcript text.
 
+    Args:
+        ymd: Meeting date as string, used in the not-found message
+        meeting_df: Transcript rows for the meeting, sorted by 'n'
+
+    Returns:
+        Utterances separated by blank lines, or a not-found message if the
+        meeting has no rows.
+    """
     if len(meeting_df) == 0:
         return f"No transcript found for meeting {ymd}"
 
-    lines = []
-    for _, row in meeting_df.iterrows():
-        # Build speaker label from title and name
-        title = str(row['titletidy']).strip() if pd.notna(row['titletidy']) else ""
-        speaker = str(row['stablespeaker']).strip() if pd.notna(row['stablespeaker']) else ""
+    return "\n\n".join(format_utterances(meeting_df).tolist())
 
-        # Format speaker label
-        if title and speaker:
-            if title.upper() in ['CHAIR', 'CHAIRMAN', 'VICE CHAIR', 'VICE CHAIRMAN']:
-                speaker_label = f"{title.upper()} {speaker}"
-            else:
-                speaker_label = f"{title.upper()}. {speaker}"
-        elif speaker:
-            speaker_label = speaker
-        else:
-            speaker_label = "UNKNOWN"
 
-        # Get the text
-        text = str(row['combined']).strip() if pd.notna(row['combined']) else ""
+def format_utterances(meeting_df: pd.DataFrame) -> pd.Series:
+    """
+    Build "SPEAKER: text" lines for a meeting's utterances.
+
+    Args:
+        meeting_df: Transcript rows for a single meeting, in speaking order
+
+    Returns:
+        Series of formatted lines, indexed like meeting_df, with rows that
+        have no text dropped.
+    """
+    title = meeting_df['titletidy'].fillna('').astype(str).str.strip().str.upper()
+    speaker = meeting_df['stablespeaker'].fillna('').astype(str).str.strip()
+    text = meeting_df['combined'].fillna('').astype(str).str.strip()
 
-        if text:
-            lines.append(f"{speaker_label}: {text}")
+    # Format speaker label
+    with_title = np.where(title.isin(_CHAIR_TITLES), title + ' ' + speaker, title + '. ' + speaker)
+    has_speaker = (speaker != '').to_numpy()
+    speaker_label = np.where(
+        (title != '').to_numpy() & has_speaker,
+        with_title,
+        np.where(has_speaker, speaker, 'UNKNOWN')
+    )
 
-    return "\n\n".join(lines)
+    lines = pd.Series(speaker_label, index=meeting_df.index) + ': ' + text
+    return lines[text != '']
 
 
-def load_transcript_df(ymd: str, transcripts_df: pd.DataFrame) -> pd.DataFrame:
+def load_transcript_df(ymd: str, transcripts_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """
     Get the transcript DataFrame for a single meeting.
 
     Args:
         ymd: Meeting date as string
-        transcripts_df: Full transcripts DataFrame
+        transcripts_df: Full transcripts DataFrame. When omitted, the shared
+            cached per-meeting frame is returned and must not be mutated.
 
     Returns:
         Filtered and sorted DataFrame for the meeting.
     """
+    if transcripts_df is None:
+        return load_meeting_transcript_df(ymd)
     return transcripts_df[transcripts_df['ymd'] == ymd].sort_values('n').copy()
 
 
-def get_transcript_stats(ymd: str, transcripts_df: pd.DataFrame) -> Dict:
+def get_transcript_stats(ymd: str, transcripts_df: Optional[pd.DataFrame] = None) -> Dict:
     """
     Get statistics about a meeting's transcript.
 
     Args:
         ymd: Meeting date as string
-        transcripts_df: Full transcripts DataFrame
+        transcripts_df: Full transcripts DataFrame. When omitted, the cached
+            per-meeting result is returned.
+
+    Returns:
+        Dictionary with word count and utterance count.
+    """
+    if transcripts_df is None:
+        return _get_transcript_stats_cached(ymd)
+    return _stats_for(transcripts_df[transcripts_df['ymd'] == ymd])
+
+
+@st.cache_data
+def _get_transcript_stats_cached(ymd: str) -> Dict:
+    """
+    Get statistics about a meeting's transcript, cached per meeting.
+
+    Args:
+        ymd: Meeting date as string
+
+    Returns:
+        Dictionary with word count and utterance count.
+    """
+    return _stats_for(load_meeting_transcript_df(ymd))
+
+
+def _stats_for(meeting_df: pd.DataFrame) -> Dict:
+    """
+    Summarize a single meeting's transcript rows.
+
+    Args:
+        meeting_df: Transcript rows for the meeting
 
     Returns:
         Dictionary with word count and utterance count.
     """
-    meeting_df = transcripts_df[transcripts_df['ymd'] == ymd]
     return {
         "word_count": int(meeting_df['words'].sum()),
         "utterance_count": len(meeting_df)
     }
 
 
-def load_alternatives(ymd: str, alternatives_df: pd.DataFrame) -> List[Dict]:
+def load_alternatives(ymd: str, alternatives_df: Optional[pd.DataFrame] = None) -> List[Dict]:
     """
     Get policy alternatives for a meeting.
 
     Args:
         ymd: Meeting date as string
-        alternatives_df: Full alternatives DataFrame
+        alternatives_df: Full alternatives DataFrame. When omitted, the
+            records are looked up in load_alternatives_by_meeting().
 
     Returns:
         List of dicts with keys: label, description, statement.
         Returns empty list if no alternatives exist.
     """
+    if alternatives_df is None:
+        return load_alternatives_by_meeting().get(ymd, [])
+
     meeting_alts = alternatives_df[alternatives_df['ymd'] == ymd]
 
     if len(meeting_alts) == 0:
@@ -123,38 +252,170 @@ def load_alternatives(ymd: str, alternatives_df: pd.DataFrame) -> List[Dict]:
     return meeting_alts[['label', 'description', 'statement']].to_dict('records')
 
 
+@st.cache_resource
+def load_alternatives_by_meeting() -> Dict[str, List[Dict]]:
+    """
+    Group the alternatives DataFrame into per-meeting records once.
+
+    Returns:
+        Dict mapping ymd to a list of dicts with keys: label, description,
+        statement. Shared across sessions; callers must not mutate it.
+    """
+    alternatives_df = load_alternatives_df()
+    return {
+        ymd: meeting_alts[['label', 'description', 'statement']].to_dict('records')
+        for ymd, meeting_alts in alternatives_df.groupby('ymd', sort=False)
+    }
+
+
 def load_decisions(ymd: str) -> Optional[pd.DataFrame]:
     """
     Load Claude's extracted decisions for a meeting from CSV.
 
+    Parsed files are cached on their path and modification time, so edits to
+    a decisions file are picked up on the next rerun.
+
     Args:
         ymd: Meeting date as string
 
     Returns:
         DataFrame with decisions, or None if file doesn't exist.
     """
-    path = Path(DATA_PATHS["decisions_dir"]) / f"adopted_decisions_{ymd}.csv"
+    path = _decisions_path(ymd)
+
+    if not path.exists():
+        return None
+
+    return _read_decisions(str(path), path.stat().st_mtime)
+
+
+def get_decisions_mtime(ymd: str) -> Optional[float]:
+    """
+    Get the modification time of a meeting's decisions file.
+
+    Useful as a cache key for anything derived from load_decisions().
+
+    Args:
+        ymd: Meeting date as string
+
+    Returns:
+        Modification time as a timestamp, or None if file doesn't exist.
+    """
+    path = _decisions_path(ymd)
 
     if not path.exists():
         return None
 
-    df = pd.read_csv(path)
+    return path.stat().st_mtime
+
+
+def get_decision_count(ymd: str) -> Optional[int]:
+    """
+    Get the number of extracted decisions for a meeting.
+
+    Args:
+        ymd: Meeting date as string
+
+    Returns:
+        Number of decisions, or None if file doesn't exist.
+    """
+    path = _decisions_path(ymd)
 
-    # Ensure required columns exist
-    required_cols = ['description', 'type', 'score', 'justification']
-    for col in required_cols:
-        if col not in df.columns:
-            df[col] = None
+    if not path.exists():
+        return None
 
-    return df
+    return _count_decisions(str(path), path.stat().st_mtime)
 
 
-def search_transcript(transcript_text: str, search_term: str) -> List[Dict]:
+def _decisions_path(ymd: str) -> Path:
     """
-    Search transcript for a term and return matching excerpts.
+    Get the path of a meeting's decisions CSV.
+
+    Args:
+        ymd: Meeting date as string
+
+    Returns:
+        Path to the CSV (which may not exist).
+    """
+    return Path(DATA_PATHS["decisions_dir"]) / f"adopted_decisions_{ymd}.csv"
+
+
+@st.cache_data
+def _count_decisions(path: str, mtime: float) -> int:
+    """
+    Count the decisions in a parsed decisions file.
+
+    Args:
+        path: Path to the decisions CSV
+        mtime: File modification time. Only used as part of the cache key,
+            so edits to the file invalidate the cached count.
+
+    Returns:
+        Number of decision rows.
+    """
+    return len(_read_decisions(path, mtime))
+
+
+@st.cache_data
+def _read_decisions(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Parse a decisions CSV into the columns the app uses.
+
+    Args:
+        path: Path to the decisions CSV
+        mtime: File modification time. Only used as part of the cache key,
+            so edits to the file invalidate the cached parse.
+
+    Returns:
+        DataFrame with description, type, score and justification columns
+        (missing columns are filled with NaN).
+    """
+    df = pd.read_csv(
+        path,
+        usecols=lambda col: col in _DECISION_COLUMNS,
+        dtype={'description': str, 'type': 'category', 'justification': str}
+    )
+
+    # Ensure required columns exist, in a fixed order
+    return df.reindex(columns=_DECISION_COLUMNS)
+
+
+def paginate_transcript(transcript_text: str, words_per_page: int) -> List[str]:
+    """
+    Split a transcript into pages of whole utterances.
 
     Args:
         transcript_text: Full transcript as string
+        words_per_page: Approximate number of words per page
+
+    Returns:
+        List of page strings (at least one, possibly empty).
+    """
+    pages = []
+    current = []
+    word_count = 0
+
+    for utterance in transcript_text.split("\n\n"):
+        current.append(utterance)
+        word_count += len(utterance.split())
+        if word_count >= words_per_page:
+            pages.append("\n\n".join(current))
+            current = []
+            word_count = 0
+
+    if current or not pages:
+        pages.append("\n\n".join(current))
+
+    return pages
+
+
+def search_transcript(utterances: pd.Series, search_term: str) -> List[Dict]:
+    """
+    Search transcript utterances for a term and return matching excerpts.
+
+    Args:
+        utterances: Formatted utterances for a meeting, as returned by
+            format_utterances
         search_term: Term to search for (case-insensitive)
 
     Returns:
@@ -163,18 +424,11 @@ def search_transcript(transcript_text: str, search_term: str) -> List[Dict]:
     if not search_term:
         return []
 
-    results = []
-    search_lower = search_term.lower()
-
-    # Split into utterances
-    utterances = transcript_text.split("\n\n")
-
-    for i, utterance in enumerate(utterances):
-        if search_lower in utterance.lower():
-            results.append({
-                "index": i,
-                "text": utterance,
-                "preview": utterance[:200] + "..." if len(utterance) > 200 else utterance
-            })
+    mask = utterances.str.contains(re.escape(search_term), case=False, regex=True)
+    matches = utterances[mask]
+    previews = matches.str.slice(0, 200) + np.where(matches.str.len() > 200, "...", "")
 
-    return results
+    return [
+        {"index": int(i), "text": text, "preview": preview}
+        for i, text, preview in zip(np.flatnonzero(mask.to_numpy()), matches, previews)
+    ]
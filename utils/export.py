@@ -1,17 +1,45 @@
 """
 Export utilities for FOMC Decision Validation Tool.
 """
-import json
+import orjson
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, List
 import os
+from functools import lru_cache
 
 from config import DATA_PATHS
 
-
-def get_results_filename(ymd: str, coder_id: str, extension: str = "json") -> str:
+# Column order for flattened CSV exports
+_CSV_COLUMNS = [
+    "meeting_date", "coder_id", "coding_timestamp", "record_type",
+    "decision_index", "claude_description", "claude_type", "claude_score",
+    "claude_justification", "human_occurred", "human_corrected_description",
+    "human_type_agree", "human_type_override", "human_score", "human_evidence",
+    "human_notes", "human_confidence", "completed"
+]
+
+# Validation dict keys carried into the CSV as-is
+_VALIDATION_CSV_COLUMNS = _CSV_COLUMNS[4:]
+
+# Missing decision dict keys and the CSV columns they fill
+_MISSING_CSV_COLUMNS = {
+    "description": "human_corrected_description",
+    "type": "human_type_override",
+    "score": "human_score",
+    "evidence": "human_evidence",
+    "notes": "human_notes",
+    "confidence": "human_confidence"
+}
+
+
+def get_results_filename(
+    ymd: str,
+    coder_id: str,
+    extension: str = "json",
+    timestamp: Optional[datetime] = None
+) -> str:
     """
     Generate a filename for coding results.
 
@@ -19,11 +47,12 @@ def get_results_filename(ymd: str, coder_id: str, extension: str = "json") -> st
         ymd: Meeting date
         coder_id: Coder identifier
         extension: File extension (json or csv)
+        timestamp: Time to embed in the name (defaults to now)
 
     Returns:
         Filename string.
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = (timestamp or datetime.now()).strftime("%Y%m%d_%H%M%S")
     return f"decisions_{ymd}_{coder_id}_{timestamp}.{extension}"
 
 
@@ -52,14 +81,15 @@ def save_coding_results(
     results_dir = Path(DATA_PATHS["results_dir"])
     results_dir.mkdir(parents=True, exist_ok=True)
 
-    filename = get_results_filename(ymd, coder_id, "json")
+    now = datetime.now()
+    filename = get_results_filename(ymd, coder_id, "json", now)
     filepath = results_dir / filename
 
     output = {
         "metadata": {
             "meeting_date": ymd,
             "coder_id": coder_id,
-            "coding_timestamp": datetime.now().isoformat(),
+            "coding_timestamp": now.isoformat(),
             "app_version": "1.0",
             **metadata
         },
@@ -68,8 +98,11 @@ def save_coding_results(
         "meeting_summary": meeting_summary
     }
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(
+            output,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
 
     return str(filepath)
 
@@ -97,83 +130,50 @@ def export_to_csv(
     results_dir = Path(DATA_PATHS["results_dir"])
     results_dir.mkdir(parents=True, exist_ok=True)
 
-    filename = get_results_filename(ymd, coder_id, "csv")
+    now = datetime.now()
+    filename = get_results_filename(ymd, coder_id, "csv", now)
     filepath = results_dir / filename
 
-    rows = []
+    timestamp = now.isoformat()
 
     # Add validated decisions
-    for val in decision_validations:
-        row = {
-            "meeting_date": ymd,
-            "coder_id": coder_id,
-            "coding_timestamp": datetime.now().isoformat(),
-            "record_type": "validated_decision",
-            "decision_index": val.get("decision_index"),
-            "claude_description": val.get("claude_description"),
-            "claude_type": val.get("claude_type"),
-            "claude_score": val.get("claude_score"),
-            "claude_justification": val.get("claude_justification"),
-            "human_occurred": val.get("human_occurred"),
-            "human_corrected_description": val.get("human_corrected_description"),
-            "human_type_agree": val.get("human_type_agree"),
-            "human_type_override": val.get("human_type_override"),
-            "human_score": val.get("human_score"),
-            "human_evidence": val.get("human_evidence"),
-            "human_notes": val.get("human_notes"),
-            "human_confidence": val.get("human_confidence"),
-            "completed": val.get("completed")
-        }
-        rows.append(row)
+    validated_df = pd.DataFrame(
+        decision_validations, columns=_VALIDATION_CSV_COLUMNS
+    ).assign(
+        meeting_date=ymd,
+        coder_id=coder_id,
+        coding_timestamp=timestamp,
+        record_type="validated_decision"
+    )
 
     # Add missing decisions
-    for i, missing in enumerate(missing_decisions):
-        row = {
-            "meeting_date": ymd,
-            "coder_id": coder_id,
-            "coding_timestamp": datetime.now().isoformat(),
-            "record_type": "missing_decision",
-            "decision_index": f"missing_{i+1}",
-            "claude_description": None,
-            "claude_type": None,
-            "claude_score": None,
-            "claude_justification": None,
-            "human_occurred": "missing",
-            "human_corrected_description": missing.get("description"),
-            "human_type_agree": None,
-            "human_type_override": missing.get("type"),
-            "human_score": missing.get("score"),
-            "human_evidence": missing.get("evidence"),
-            "human_notes": missing.get("notes"),
-            "human_confidence": missing.get("confidence"),
-            "completed": True
-        }
-        rows.append(row)
+    missing_df = pd.DataFrame(
+        missing_decisions, columns=list(_MISSING_CSV_COLUMNS)
+    ).rename(columns=_MISSING_CSV_COLUMNS).assign(
+        meeting_date=ymd,
+        coder_id=coder_id,
+        coding_timestamp=timestamp,
+        record_type="missing_decision",
+        decision_index=[f"missing_{i+1}" for i in range(len(missing_decisions))],
+        human_occurred="missing",
+        completed=True
+    )
 
     # Add summary row
-    summary_row = {
+    summary_df = pd.DataFrame([{
         "meeting_date": ymd,
         "coder_id": coder_id,
-        "coding_timestamp": datetime.now().isoformat(),
+        "coding_timestamp": timestamp,
         "record_type": "meeting_summary",
-        "decision_index": None,
-        "claude_description": None,
-        "claude_type": None,
-        "claude_score": None,
-        "claude_justification": None,
-        "human_occurred": None,
-        "human_corrected_description": None,
-        "human_type_agree": None,
-        "human_type_override": None,
-        "human_score": None,
-        "human_evidence": None,
         "human_notes": meeting_summary.get("general_notes"),
         "human_confidence": meeting_summary.get("overall_assessment"),
         "completed": meeting_summary.get("all_decisions_complete")
-    }
-    rows.append(summary_row)
+    }])
 
-    df = pd.DataFrame(rows)
+    # Concatenate as object columns and infer dtypes over all rows at once, so
+    # the result does not depend on how pandas resolves all-NA sections
+    frames = [df.astype(object) for df in (validated_df, missing_df, summary_df) if not df.empty]
+    df = pd.concat(frames, ignore_index=True).reindex(columns=_CSV_COLUMNS).infer_objects()
     df.to_csv(filepath, index=False)
 
     return str(filepath)
@@ -196,23 +196,31 @@ def load_existing_results(ymd: str, coder_id: str) -> Optional[Dict]:
         return None
 
     # Find matching files
-    pattern = f"decisions_{ymd}_{coder_id}_*.json"
-    matching_files = list(results_dir.glob(pattern))
+    prefix = f"decisions_{ymd}_{coder_id}_"
+    with os.scandir(results_dir) as entries:
+        matching_files = [
+            entry.name for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(".json")
+        ]
 
     if not matching_files:
         return None
 
-    # Get most recent
-    most_recent = max(matching_files, key=lambda p: p.stat().st_mtime)
+    # Get most recent; names end in a zero-padded YYYYMMDD_HHMMSS timestamp
+    # (see get_results_filename), so the largest name is the newest file
+    most_recent = results_dir / max(matching_files)
 
-    with open(most_recent, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(most_recent, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def list_existing_results(coder_id: Optional[str] = None) -> List[Dict]:
     """
     List all existing result files.
 
+    The listing is cached on the results directory's modification time, so
+    it is only rebuilt after files are added, removed or renamed.
+
     Args:
         coder_id: Optional filter by coder ID
 
@@ -224,21 +232,44 @@ def list_existing_results(coder_id: Optional[str] = None) -> List[Dict]:
     if not results_dir.exists():
         return []
 
-    results = []
-    for filepath in results_dir.glob("decisions_*.json"):
-        parts = filepath.stem.split("_")
-        if len(parts) >= 4:
-            file_ymd = parts[1]
-            file_coder = parts[2]
+    listing = _list_results(str(results_dir), results_dir.stat().st_mtime, coder_id)
+    return [dict(info) for info in listing]
 
-            if coder_id and file_coder != coder_id:
+
+@lru_cache(maxsize=32)
+def _list_results(results_dir: str, dir_mtime: float, coder_id: Optional[str]) -> tuple:
+    """
+    Scan the results directory for saved JSON results.
+
+    Args:
+        results_dir: Path to the results directory
+        dir_mtime: Directory modification time. Only used as part of the
+            cache key, so adding or removing files invalidates the listing.
+        coder_id: Optional filter by coder ID
+
+    Returns:
+        Tuple of dicts with file info, newest first. Shared by the cache;
+        list_existing_results hands out copies.
+    """
+    results = []
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if not (entry.name.startswith("decisions_") and entry.name.endswith(".json")):
                 continue
 
-            results.append({
-                "filename": filepath.name,
-                "meeting_date": file_ymd,
-                "coder_id": file_coder,
-                "modified": datetime.fromtimestamp(filepath.stat().st_mtime).isoformat()
-            })
+            parts = entry.name[:-len(".json")].split("_")
+            if len(parts) >= 4:
+                file_ymd = parts[1]
+                file_coder = parts[2]
+
+                if coder_id and file_coder != coder_id:
+                    continue
+
+                results.append({
+                    "filename": entry.name,
+                    "meeting_date": file_ymd,
+                    "coder_id": file_coder,
+                    "modified": datetime.fromtimestamp(entry.stat().st_mtime).isoformat()
+                })
 
-    return sorted(results, key=lambda x: x["modified"], reverse=True)
+    return tuple(sorted(results, key=lambda x: x["modified"], reverse=True))